@@ -38,6 +38,98 @@ bot = TeleBot(BOT_TOKEN)
 user_sessions = {}
 TEMP_DIR = tempfile.gettempdir()
 
+RADIX_ALPHABETS = {
+    'base58': '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz',
+    'base58_flickr': '123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ',
+    'base58_ripple': 'rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz',
+    'base62': '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz',
+    'base36': '0123456789abcdefghijklmnopqrstuvwxyz',
+}
+BASE91_ALPHABET = ('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+                   '0123456789!#$%&()*+,./:;<=>?@[]^_`{|}~"')
+RADIX_LEAF_DIGITS = 64
+RADIX_AUTO_FORMATS = {'Base58'}
+RADIX_AUTO_MIN_LENGTH = 16
+
+def _build_table(alphabet):
+    # 256-entry bytes.translate table: char -> digit value, 0xFF for invalid
+    table = bytearray(b'\xff' * 256)
+    for value, char in enumerate(alphabet):
+        table[ord(char)] = value
+    return bytes(table)
+
+RADIX_TABLES = {name: _build_table(alphabet) for name, alphabet in RADIX_ALPHABETS.items()}
+BASE91_TABLE = _build_table(BASE91_ALPHABET)
+
+def _digits_to_int(digits, base, powers):
+    # Divide and conquer keeps both halves balanced so the big-int
+    # multiplications stay subquadratic instead of growing one digit at a time
+    if len(digits) <= RADIX_LEAF_DIGITS:
+        value = 0
+        for digit in digits:
+            value = value * base + digit
+        return value
+    mid = len(digits) // 2
+    high = _digits_to_int(digits[:mid], base, powers)
+    low = _digits_to_int(digits[mid:], base, powers)
+    exponent = len(digits) - mid
+    if exponent not in powers:
+        powers[exponent] = base ** exponent
+    return high * powers[exponent] + low
+
+def _translate_digits(x, table, name):
+    text = ''.join(x.split())
+    try:
+        raw = text.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError(f"Invalid {name} character")
+    digits = raw.translate(table)
+    if b'\xff' in digits:
+        bad = text[digits.index(b'\xff')]
+        raise ValueError(f"Invalid {name} character: {bad!r}")
+    return digits
+
+def radix_decode(x, name):
+    alphabet = RADIX_ALPHABETS[name]
+    if name == 'base36':
+        x = x.lower()
+    digits = _translate_digits(x, RADIX_TABLES[name], name)
+    zeros = len(digits) - len(digits.lstrip(b'\x00'))
+    value = _digits_to_int(digits[zeros:], len(alphabet), {})
+    body = value.to_bytes((value.bit_length() + 7) // 8, 'big') if value else b''
+    return b'\x00' * zeros + body
+
+def _plausible_radix(encoded, decoded):
+    # Short words and spaced plaintext are valid radix input too; in auto-detect
+    # only accept a single unbroken token that decodes to mostly printable text
+    if len(encoded) < RADIX_AUTO_MIN_LENGTH or len(encoded.split()) != 1:
+        return False
+    printable = sum(1 for char in decoded if char.isprintable() or char in '\r\n\t')
+    return printable >= len(decoded) * 0.95
+
+def base91_decode(x):
+    # basE91 packs 13 or 14 bits per character pair, so a single linear pass suffices
+    digits = _translate_digits(x, BASE91_TABLE, 'base91')
+    out = bytearray()
+    queue = 0
+    nbits = 0
+    pending = -1
+    for digit in digits:
+        if pending < 0:
+            pending = digit
+            continue
+        pending += digit * 91
+        queue |= pending << nbits
+        nbits += 13 if (pending & 8191) > 88 else 14
+        while nbits > 7:
+            out.append(queue & 0xFF)
+            queue >>= 8
+            nbits -= 8
+        pending = -1
+    if pending >= 0:
+        out.append((queue | pending << nbits) & 0xFF)
+    return bytes(out)
+
 class Decoder:
     @staticmethod
     def hex(x):
@@ -161,11 +253,27 @@ class Decoder:
     
     @staticmethod
     def base58(x):
-        ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-        decoded = 0
-        for char in x:
-            decoded = decoded * 58 + ALPHABET.index(char)
-        return decoded.to_bytes((decoded.bit_length() + 7) // 8, 'big').decode('utf-8', errors='ignore')
+        return radix_decode(x, 'base58').decode('utf-8')
+    
+    @staticmethod
+    def base58_flickr(x):
+        return radix_decode(x, 'base58_flickr').decode('utf-8')
+    
+    @staticmethod
+    def base58_ripple(x):
+        return radix_decode(x, 'base58_ripple').decode('utf-8')
+    
+    @staticmethod
+    def base62(x):
+        return radix_decode(x, 'base62').decode('utf-8')
+    
+    @staticmethod
+    def base36(x):
+        return radix_decode(x, 'base36').decode('utf-8')
+    
+    @staticmethod
+    def base91(x):
+        return base91_decode(x).decode('utf-8')
     
     @staticmethod
     def reverse(x):
@@ -210,6 +318,7 @@ class Decoder:
             ('URL-B64+Zlib', Decoder.url_b64_zlib),
             ('Zlib', Decoder.zlib_data),
             ('Marshal', Decoder.marshal),
+            ('Base58', Decoder.base58),
             ('ROT13', Decoder.rot13),
             ('ROT47', Decoder.rot47),
             ('Bytes', Decoder.bytes_decoder),
@@ -236,6 +345,9 @@ class Decoder:
                     new_str = str(new_data).strip()
                     current_str_cmp = current_str.strip()
                     
+                    if name in RADIX_AUTO_FORMATS and not _plausible_radix(current_str_cmp, new_str):
+                        raise ValueError(f"Implausible {name} result")
+                    
                     if new_str and new_str != current_str_cmp and len(new_str) < 5000000:
                         current = new_data
                         tried.add(key)
@@ -266,6 +378,9 @@ def get_more_keyboard():
     keyboard = types.ReplyKeyboardMarkup(one_time_keyboard=False, resize_keyboard=True)
     keyboard.add(types.KeyboardButton("📋 Escape"), types.KeyboardButton("🔀 Reverse"))
     keyboard.add(types.KeyboardButton("🔢 Base16"), types.KeyboardButton("📌 Base58"))
+    keyboard.add(types.KeyboardButton("📍 Base58 Flickr"), types.KeyboardButton("🌊 Base58 Ripple"))
+    keyboard.add(types.KeyboardButton("🧮 Base62"), types.KeyboardButton("🔣 Base36"))
+    keyboard.add(types.KeyboardButton("🧬 Base91"))
     keyboard.add(types.KeyboardButton("🎨 Atbash"), types.KeyboardButton("📤 UU Encode"))
     keyboard.add(types.KeyboardButton("💬 Quoted-Print"), types.KeyboardButton("🔡 ROT47"))
     keyboard.add(types.KeyboardButton("◀️ Back to Menu"))
@@ -340,7 +455,7 @@ Python Deobfuscation & Decoding Bot
 **41+ Integrated Decoders:**
 Hex • Base16/32/64/85 • ASCII85 • Zlib
 Marshal • ROT13/47 • URL Decode • HTML
-Atbash • Base58 • UU Encode • Escape Sequences
+Atbash • Base58/62/36/91 • UU Encode • Escape Sequences
 And 20+ combinations of layered encoding!
 
 **Features:**
@@ -447,7 +562,37 @@ def base16_menu(message):
 def base58_menu(message):
     user_id = message.chat.id
     user_sessions[user_id] = {'state': 'decoder_b58'}
-    bot.send_message(user_id, "📤 Send Base58 encoded text", reply_markup=get_back_keyboard())
+    bot.send_message(user_id, "📤 Send Base58 encoded text or file", reply_markup=get_back_keyboard())
+
+@bot.message_handler(func=lambda msg: msg.text in ["📍 Base58 Flickr", "/base58flickr"])
+def base58_flickr_menu(message):
+    user_id = message.chat.id
+    user_sessions[user_id] = {'state': 'decoder_b58_flickr'}
+    bot.send_message(user_id, "📤 Send Base58 (Flickr) encoded text or file", reply_markup=get_back_keyboard())
+
+@bot.message_handler(func=lambda msg: msg.text in ["🌊 Base58 Ripple", "/base58ripple"])
+def base58_ripple_menu(message):
+    user_id = message.chat.id
+    user_sessions[user_id] = {'state': 'decoder_b58_ripple'}
+    bot.send_message(user_id, "📤 Send Base58 (Ripple) encoded text or file", reply_markup=get_back_keyboard())
+
+@bot.message_handler(func=lambda msg: msg.text in ["🧮 Base62", "/base62"])
+def base62_menu(message):
+    user_id = message.chat.id
+    user_sessions[user_id] = {'state': 'decoder_b62'}
+    bot.send_message(user_id, "📤 Send Base62 encoded text or file", reply_markup=get_back_keyboard())
+
+@bot.message_handler(func=lambda msg: msg.text in ["🔣 Base36", "/base36"])
+def base36_menu(message):
+    user_id = message.chat.id
+    user_sessions[user_id] = {'state': 'decoder_b36'}
+    bot.send_message(user_id, "📤 Send Base36 encoded text or file", reply_markup=get_back_keyboard())
+
+@bot.message_handler(func=lambda msg: msg.text in ["🧬 Base91", "/base91"])
+def base91_menu(message):
+    user_id = message.chat.id
+    user_sessions[user_id] = {'state': 'decoder_b91'}
+    bot.send_message(user_id, "📤 Send Base91 encoded text or file", reply_markup=get_back_keyboard())
 
 @bot.message_handler(func=lambda msg: msg.text in ["🎨 Atbash", "/atbash"])
 def atbash_menu(message):
@@ -520,6 +665,11 @@ def text_handler(message):
         'decoder_url_decode': ('URL Decode', Decoder.url_decode),
         'decoder_html_decode': ('HTML Decode', Decoder.html_decode),
         'decoder_b58': ('Base58', Decoder.base58),
+        'decoder_b58_flickr': ('Base58 Flickr', Decoder.base58_flickr),
+        'decoder_b58_ripple': ('Base58 Ripple', Decoder.base58_ripple),
+        'decoder_b62': ('Base62', Decoder.base62),
+        'decoder_b36': ('Base36', Decoder.base36),
+        'decoder_b91': ('Base91', Decoder.base91),
         'decoder_reverse': ('Reverse', Decoder.reverse),
         'decoder_escape_decode': ('Escape', Decoder.escape_decode),
         'decoder_atbash': ('Atbash', Decoder.atbash),
@@ -559,6 +709,12 @@ def file_handler(message):
             'decoder_rot13': ('ROT13', Decoder.rot13),
             'decoder_url_decode': ('URL Decode', Decoder.url_decode),
             'decoder_html_decode': ('HTML Decode', Decoder.html_decode),
+            'decoder_b58': ('Base58', Decoder.base58),
+            'decoder_b58_flickr': ('Base58 Flickr', Decoder.base58_flickr),
+            'decoder_b58_ripple': ('Base58 Ripple', Decoder.base58_ripple),
+            'decoder_b62': ('Base62', Decoder.base62),
+            'decoder_b36': ('Base36', Decoder.base36),
+            'decoder_b91': ('Base91', Decoder.base91),
             'auto_detect_waiting': ('Auto-Detect', None),
         }
         